@@ -0,0 +1,17 @@
+# Generated by Django 4.0.3 on 2026-10-14 12:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ghubscraper', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='repo',
+            constraint=models.UniqueConstraint(fields=('account', 'repo'), name='uniq_account_repo'),
+        ),
+    ]
@@ -3,6 +3,11 @@
 from django.core.validators import RegexValidator
 from django.db import models
 
+# the captured group is the account name
+GITHUB_ACCOUNT_URL_REGEX = (
+    r"^https?://github\.com/([a-z0-9](?:[a-z\d]|-(?=[a-z\d])){0,38})/?$"
+)
+
 
 class Repo(models.Model):
     """Model representing a GitHub repo data."""
@@ -10,7 +15,7 @@ class Repo(models.Model):
     account = models.URLField(
         validators=[
             RegexValidator(
-                r"^https?://github.com/[a-z0-9](?:[a-z\d]|-(?=[a-z\d])){0,38}/?$",
+                GITHUB_ACCOUNT_URL_REGEX,
                 message="All URLs must be of the following format: "
                 "http(s)://github.com/<account>(/)",
             )
@@ -35,5 +40,13 @@ class Repo(models.Model):
     latest_release_datetime = models.DateTimeField(null=True, blank=True)
     latest_release_changelog = models.TextField(blank=True)
 
+    class Meta:
+        # the index backing the constraint also serves lookups by account alone
+        constraints = [
+            models.UniqueConstraint(
+                fields=["account", "repo"], name="uniq_account_repo"
+            )
+        ]
+
     def __str__(self):
         return self.account
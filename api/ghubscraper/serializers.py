@@ -2,7 +2,7 @@
 
 from rest_framework import serializers
 
-from ghubscraper.models import Repo
+from ghubscraper.models import GITHUB_ACCOUNT_URL_REGEX, Repo
 
 
 class RepoSerializer(serializers.ModelSerializer):
@@ -33,15 +33,11 @@ class CrawlSerializer(serializers.Serializer):
     "Serializer for a list of URLs to scrape."
 
     start_urls = serializers.ListField(
-        child=serializers.RegexField(
-            r"^https?://github.com/[a-z0-9](?:[a-z\d]|-(?=[a-z\d])){0,38}/?$"
-        )
+        child=serializers.RegexField(GITHUB_ACCOUNT_URL_REGEX)
     )
 
 
 class AccountSerializer(serializers.Serializer):
     """Serializer for account URL."""
 
-    account = serializers.RegexField(
-        r"^https?://github.com/[a-z0-9](?:[a-z\d]|-(?=[a-z\d])){0,38}/?$"
-    )
+    account = serializers.RegexField(GITHUB_ACCOUNT_URL_REGEX)
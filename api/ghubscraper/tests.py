@@ -1,5 +1,327 @@
 """This module contains tests for the app."""
 
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import IntegrityError, connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from . import views
+from .models import Repo
+
+
+class AddRepoTests(TestCase):
+    """Tests for the view that adds a single repo."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("add_repo")
+        cache.clear()
+
+    def test_rewrites_existing_repo(self):
+        """Fields missing from a repeated request are reset, not kept."""
+        self.client.post(
+            self.url,
+            {
+                "account": "http://github.com/ubuntu/",
+                "repo": "ubuntu-make",
+                "about": "old",
+                "release_count": 3,
+            },
+            format="json",
+        )
+        response = self.client.post(
+            self.url,
+            {"account": "https://github.com/ubuntu", "repo": "ubuntu-make", "stars": 1},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        repo = Repo.objects.get()
+        self.assertEqual(repo.account, "https://github.com/ubuntu")
+        self.assertEqual(repo.stars, 1)
+        self.assertEqual(repo.about, "")
+        self.assertIsNone(repo.release_count)
+
+    def test_strips_whitespace_around_account(self):
+        response = self.client.post(
+            self.url,
+            {"account": " https://github.com/ubuntu ", "repo": "ubuntu-make"},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Repo.objects.get().account, "https://github.com/ubuntu")
+
+    def test_account_without_repos_is_not_counted_as_repo(self):
+        self.client.post(
+            self.url,
+            {"account": "https://github.com/ubuntu", "repo": "ubuntu-make"},
+            format="json",
+        )
+        response = self.client.post(
+            self.url, {"account": "https://github.com/empty"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            self.client.get(reverse("stats")).data,
+            {"account_count": 1, "repo_count": 1, "avg_repo_count": 1.0},
+        )
+
+
+class AddRepoBulkTests(TestCase):
+    """Tests for the view that adds a batch of repos."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse("add_repo_bulk")
+        cache.clear()
+
+    def post_items(self, items):
+        return self.client.post(self.url, {"items": items}, format="json")
+
+    def test_replaces_existing_repos(self):
+        Repo.objects.create(
+            account="https://github.com/scrapy", repo="scrapy", about="old", stars=1
+        )
+        response = self.post_items(
+            [{"account": "http://github.com/scrapy/", "repo": "scrapy", "stars": 2}]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data, {"count": 1, "rejected": []})
+        repo = Repo.objects.get()
+        self.assertEqual(repo.account, "https://github.com/scrapy")
+        self.assertEqual(repo.stars, 2)
+        self.assertEqual(repo.about, "")
+
+    def test_keeps_last_duplicate_in_batch(self):
+        response = self.post_items(
+            [
+                {"account": "https://github.com/scrapy", "repo": "scrapy", "stars": 1},
+                {"account": "https://github.com/scrapy/", "repo": "scrapy", "stars": 2},
+            ]
+        )
+
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(Repo.objects.get().stars, 2)
+
+    def test_saves_account_without_repos(self):
+        response = self.post_items([{"account": "https://github.com/empty"}])
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        repo = Repo.objects.get()
+        self.assertEqual(repo.account, "https://github.com/empty")
+        self.assertEqual(repo.repo, "")
+
+    def test_account_without_repos_is_not_counted_as_repo(self):
+        self.post_items(
+            [
+                {"account": "https://github.com/scrapy", "repo": "scrapy"},
+                {"account": "https://github.com/empty"},
+            ]
+        )
+
+        self.assertEqual(
+            self.client.get(reverse("stats")).data,
+            {"account_count": 1, "repo_count": 1, "avg_repo_count": 1.0},
+        )
+        self.assertEqual(
+            self.client.post(
+                reverse("stats"), {"account": "https://github.com/empty"}, format="json"
+            ).data,
+            "This account has not been crawled yet.",
+        )
+
+    def test_rejects_only_invalid_items(self):
+        response = self.post_items(
+            [
+                {"account": "https://github.com/scrapy", "repo": "scrapy"},
+                {
+                    "account": "https://github.com/scrapy",
+                    "repo": "w3lib",
+                    "about": "a" * 300,
+                },
+            ]
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["count"], 1)
+        self.assertEqual(
+            [rejected["index"] for rejected in response.data["rejected"]], [1]
+        )
+        self.assertEqual(Repo.objects.get().repo, "scrapy")
+
+    def test_retries_batch_after_concurrent_insert(self):
+        bulk_create = Repo.objects.bulk_create
+        calls = []
+
+        def flaky_bulk_create(objs):
+            calls.append(objs)
+            if len(calls) == 1:
+                raise IntegrityError
+            return bulk_create(objs)
+
+        with mock.patch.object(Repo.objects, "bulk_create", flaky_bulk_create):
+            response = self.post_items(
+                [{"account": "https://github.com/scrapy", "repo": "scrapy"}]
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(Repo.objects.get().repo, "scrapy")
+
+    def test_conflict_after_repeated_concurrent_inserts(self):
+        with mock.patch.object(Repo.objects, "bulk_create", side_effect=IntegrityError):
+            response = self.post_items(
+                [{"account": "https://github.com/scrapy", "repo": "scrapy"}]
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_409_CONFLICT)
+        self.assertFalse(Repo.objects.exists())
+
+    def test_requires_list_of_items(self):
+        response = self.client.post(self.url, [], format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class AccountUrlValidationTests(TestCase):
+    """Tests for handling malformed account URLs."""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_stats_rejects_non_github_domain(self):
+        response = self.client.post(
+            reverse("stats"), {"account": "https://githubxcom/foo"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_stats_strips_whitespace_around_account(self):
+        Repo.objects.create(
+            account="https://github.com/foo", repo="bar", main_branch_commit_count=5
+        )
+        response = self.client.post(
+            reverse("stats"), {"account": " https://github.com/foo/"}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["top_repos_by_commit_count"], ["bar"])
+
+    def test_crawl_rejects_non_github_domain(self):
+        with mock.patch.object(views._SCRAPYD_SESSION, "post") as post:
+            response = self.client.post(
+                reverse("crawl_pages"),
+                {"start_urls": ["https://githubxcom/foo"]},
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        post.assert_not_called()
+
+
+class CacheInvalidationTests(TestCase):
+    """Tests that cached account lists and stats reflect new writes."""
+
+    def setUp(self):
+        self.client = APIClient()
+        cache.clear()
+        # fill the cache before any writes
+        self.assertEqual(self.get_accounts(), [])
+        self.assertEqual(self.get_stats()["repo_count"], 0)
+
+    def get_accounts(self):
+        return self.client.get(reverse("list_accounts")).data["accounts"]
+
+    def get_stats(self):
+        return self.client.get(reverse("stats")).data
+
+    def test_add_invalidates_cache(self):
+        self.client.post(
+            reverse("add_repo"),
+            {"account": "https://github.com/ubuntu", "repo": "ubuntu-make"},
+            format="json",
+        )
+
+        self.assertEqual(self.get_accounts(), ["https://github.com/ubuntu"])
+        self.assertEqual(self.get_stats()["repo_count"], 1)
+
+    def test_add_bulk_invalidates_cache(self):
+        self.client.post(
+            reverse("add_repo_bulk"),
+            {
+                "items": [
+                    {"account": "https://github.com/scrapy", "repo": "scrapy"},
+                    {"account": "https://github.com/scrapy", "repo": "w3lib"},
+                ]
+            },
+            format="json",
+        )
+
+        self.assertEqual(self.get_accounts(), ["https://github.com/scrapy"])
+        self.assertEqual(self.get_stats()["repo_count"], 2)
+
+    def test_crawl_invalidates_cache(self):
+        Repo.objects.create(account="https://github.com/scrapy", repo="scrapy")
+        cache.clear()
+        self.assertEqual(self.get_accounts(), ["https://github.com/scrapy"])
+        self.assertEqual(self.get_stats()["repo_count"], 1)
+
+        with mock.patch.object(
+            views._SCRAPYD_SESSION, "post", return_value=mock.Mock(status_code=200)
+        ):
+            self.client.post(
+                reverse("crawl_pages"),
+                {"start_urls": ["https://github.com/scrapy"]},
+                format="json",
+            )
+
+        self.assertEqual(self.get_accounts(), [])
+        self.assertEqual(self.get_stats()["repo_count"], 0)
+
+
+class CrawlPagesTests(TestCase):
+    """Tests for the view that starts crawling."""
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_deduplicates_urls_and_drops_stored_repos_once(self):
+        Repo.objects.create(account="https://github.com/scrapy", repo="scrapy")
+        Repo.objects.create(account="https://github.com/scrapy", repo="w3lib")
+        Repo.objects.create(account="https://github.com/ubuntu", repo="ubuntu-make")
+
+        with mock.patch.object(
+            views._SCRAPYD_SESSION, "post", return_value=mock.Mock(status_code=200)
+        ) as post, CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                reverse("crawl_pages"),
+                {
+                    "start_urls": [
+                        "http://github.com/scrapy/",
+                        "https://github.com/scrapy",
+                        "https://github.com/scrapy/",
+                    ]
+                },
+                format="json",
+            )
 
-# Create your tests here.
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data, {"start_urls": ["https://github.com/scrapy"]})
+        deletes = [query for query in queries if query["sql"].startswith("DELETE")]
+        self.assertEqual(len(deletes), 1)
+        self.assertEqual(
+            list(Repo.objects.values_list("account", flat=True)),
+            ["https://github.com/ubuntu"],
+        )
+        post.assert_called_once()
+        self.assertEqual(
+            post.call_args.kwargs["data"]["start_urls"], "https://github.com/scrapy"
+        )
@@ -2,16 +2,41 @@
 
 import datetime
 import os
+import re
 
 import requests
-from django.db.models import Avg
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Avg, Count, Max, Q
 from django.shortcuts import redirect
 from rest_framework import generics, status
 from rest_framework.response import Response
 
-from .models import Repo
+from .models import GITHUB_ACCOUNT_URL_REGEX, Repo
 from .serializers import AccountSerializer, CrawlSerializer, RepoSerializer
 
+# cache keys for responses that only change when repo data is written;
+# a write landing between a view's read and its cache.set() can leave a stale
+# value cached, which is accepted for up to the cache TIMEOUT (300 seconds)
+ACCOUNTS_CACHE_KEY = "accounts:list"
+STATS_CACHE_KEY = "stats:global"
+
+GITHUB_ACCOUNT_URL_RE = re.compile(GITHUB_ACCOUNT_URL_REGEX)
+
+# accounts with no repos are stored as a single row with an empty repo name,
+# which stats must not count as a repo
+HAS_REPO = ~Q(repo="")
+
+SCRAPYD_HOST = (os.getenv("SCRAPYD_HOST") or "http://scrapyd:6800").rstrip("/")
+SCRAPYD_SCHEDULE_URL = SCRAPYD_HOST + "/schedule.json"
+SCRAPYD_TIMEOUT = 5
+
+# reuse pooled keep-alive connections to scrapyd across requests
+_SCRAPYD_SESSION = requests.Session()
+_SCRAPYD_SESSION.mount(
+    "http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+)
+
 
 # use CreateAPIView for default form value
 class AddRepo(generics.CreateAPIView):
@@ -32,24 +57,87 @@ class AddRepo(generics.CreateAPIView):
         """Save request data to the database."""
         # use many=False since only single object is expected
         serializer = RepoSerializer(data=request.data, many=False)
-        data = request.data
-        data["account"] = clean_url(data["account"])
         if serializer.is_valid():
+            data = serializer.validated_data
+            # rewrite existing item in place, resetting fields missing from the request
+            instance, _ = Repo.objects.update_or_create(
+                account=clean_url(data["account"]),
+                repo=data.get("repo", ""),
+                defaults={
+                    field: data.get(field, Repo._meta.get_field(field).get_default())
+                    for field in RepoSerializer.Meta.fields
+                    if field not in ("account", "repo")
+                },
+            )
+            invalidate_cache()
 
-            # drop existing items
-            queryset = Repo.objects.filter(account=data["account"], repo=data["repo"])
-            if queryset:
-                for record in queryset:
-                    record.delete()
+            return Response(
+                data=RepoSerializer(instance).data, status=status.HTTP_201_CREATED
+            )
 
-            # save new item
-            instance = Repo(**data)
-            instance.account = data["account"]
-            instance.save()
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-            return Response(data=data, status=status.HTTP_201_CREATED)
 
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+class AddRepoBulk(generics.CreateAPIView):
+    """View that adds data on multiple repos to the database at once."""
+
+    serializer_class = RepoSerializer
+
+    def get(self, request):
+        """Return usage info message."""
+        return Response(
+            {
+                "info": "Make a POST request against this endpoint (/add_bulk/) "
+                "with a list of 'items' to add new repo data."
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    def post(self, request):
+        """Save a batch of repo data to the database, skipping invalid items."""
+        items = request.data.get("items") if isinstance(request.data, dict) else None
+        if not isinstance(items, list):
+            return Response(
+                "A list of 'items' must be provided.", status.HTTP_400_BAD_REQUEST
+            )
+
+        # keep the last item for each repo so the batch itself has no duplicates
+        rows = {}
+        rejected = []
+        for index, item in enumerate(items):
+            serializer = RepoSerializer(data=item, many=False)
+            if not serializer.is_valid():
+                rejected.append({"index": index, "errors": serializer.errors})
+                continue
+            data = serializer.validated_data
+            data["account"] = clean_url(data["account"])
+            rows[(data["account"], data.get("repo", ""))] = data
+
+        if rows:
+            stored = Q()
+            for account, repo in rows:
+                stored |= Q(account=account, repo=repo)
+            # a concurrent write can insert one of the rows after the DELETE,
+            # so retry the whole batch once before giving up
+            for attempt in range(2):
+                try:
+                    # rewrite existing items with one DELETE and one INSERT
+                    with transaction.atomic():
+                        Repo.objects.filter(stored).delete()
+                        Repo.objects.bulk_create(Repo(**data) for data in rows.values())
+                    break
+                except IntegrityError:
+                    if attempt:
+                        return Response(
+                            "Repo data was changed concurrently, retry the request.",
+                            status.HTTP_409_CONFLICT,
+                        )
+            invalidate_cache()
+
+        return Response(
+            {"count": len(rows), "rejected": rejected},
+            status=status.HTTP_201_CREATED,
+        )
 
 
 class CrawlPages(generics.CreateAPIView):
@@ -74,30 +162,30 @@ class CrawlPages(generics.CreateAPIView):
             return Response("No URLs have been provided.", status.HTTP_400_BAD_REQUEST)
 
         if serializer.is_valid():
-            validated_urls = []
-            for url in request.data["start_urls"]:
-                validated_urls.append(cleaned_url := clean_url(url))
-
-                # drop existing items
-                queryset = Repo.objects.filter(account=cleaned_url)
-                if queryset:
-                    for record in queryset:
-                        record.delete()
-
             # remove duplicates
-            request.data["start_urls"] = list(set(validated_urls))
-
-            response = requests.post(
-                (os.getenv("SCRAPYD_HOST") or "http://scrapyd:6800") + "/schedule.json",
-                data={
-                    "start_urls": ",".join(request.data["start_urls"]),
-                    "project": "scraper",
-                    "spider": "scraper_api",
-                    "jobid": datetime.datetime.now().strftime("%Y-%m-%dT%H_%M_%S"),
-                },
+            start_urls = list(
+                {clean_url(url) for url in serializer.validated_data["start_urls"]}
             )
-            if response.status_code == 200:
-                return Response(request.data, status=status.HTTP_200_OK)
+
+            # drop existing items in a single query
+            Repo.objects.filter(account__in=start_urls).delete()
+            invalidate_cache()
+
+            try:
+                response = _SCRAPYD_SESSION.post(
+                    SCRAPYD_SCHEDULE_URL,
+                    data={
+                        "start_urls": ",".join(start_urls),
+                        "project": "scraper",
+                        "spider": "scraper_api",
+                        "jobid": datetime.datetime.now().strftime("%Y-%m-%dT%H_%M_%S"),
+                    },
+                    timeout=SCRAPYD_TIMEOUT,
+                )
+            except requests.RequestException:
+                response = None
+            if response is not None and response.status_code == 200:
+                return Response({"start_urls": start_urls}, status=status.HTTP_200_OK)
 
             return Response(
                 "Error connecting to scrapyd server.", status.HTTP_400_BAD_REQUEST
@@ -117,8 +205,15 @@ class ListAccounts(generics.ListAPIView):
 
     def get(self, request):
         """Get a list of scraped accounts."""
-        queryset = set(item["account"] for item in Repo.objects.values("account"))
-        return Response({"accounts": sorted(list(queryset))}, status=status.HTTP_200_OK)
+        accounts = cache.get(ACCOUNTS_CACHE_KEY)
+        if accounts is None:
+            accounts = list(
+                Repo.objects.order_by("account")
+                .values_list("account", flat=True)
+                .distinct()
+            )
+            cache.set(ACCOUNTS_CACHE_KEY, accounts)
+        return Response({"accounts": accounts}, status=status.HTTP_200_OK)
 
 
 class Index(generics.ListAPIView):
@@ -136,16 +231,20 @@ class Stats(generics.ListAPIView):
 
     def get(self, request):
         """Get info about all stored GitHub accounts."""
-        queryset = Repo.objects.values("account", "repo")
-        return Response(
-            {
-                "account_count": (
-                    account_count := queryset.values("account").distinct().count()
-                ),
-                "repo_count": (repo_count := queryset.count()),
+        stats = cache.get(STATS_CACHE_KEY)
+        if stats is None:
+            counts = Repo.objects.aggregate(
+                account_count=Count("account", distinct=True, filter=HAS_REPO),
+                repo_count=Count("id", filter=HAS_REPO),
+            )
+            account_count, repo_count = counts["account_count"], counts["repo_count"]
+            stats = {
+                "account_count": account_count,
+                "repo_count": repo_count,
                 "avg_repo_count": repo_count / account_count if account_count else 0,
             }
-        )
+            cache.set(STATS_CACHE_KEY, stats)
+        return Response(stats)
 
     def post(self, request):
         """Request info on a specific GitHub account."""
@@ -155,33 +254,29 @@ class Stats(generics.ListAPIView):
                 "No account URL has been provided.", status.HTTP_400_BAD_REQUEST
             )
         if serializer.is_valid():
-            cleaned_account = clean_url(request.data["account"])
+            cleaned_account = clean_url(serializer.validated_data["account"])
             queryset = Repo.objects.filter(account=cleaned_account)
-            if queryset:
-                max_commit_count = max(
-                    item["main_branch_commit_count"]
-                    if item["main_branch_commit_count"] is not None
-                    else 0
-                    for item in queryset.values("main_branch_commit_count")
-                )
-
-                top_repos_by_commit_count = queryset.filter(
-                    main_branch_commit_count=max_commit_count
-                ).values("repo")
+            stats = queryset.aggregate(
+                repo_count=Count("id", filter=HAS_REPO),
+                max_commit_count=Max("main_branch_commit_count"),
+                avg_stars_count=Avg("stars"),
+            )
+            if stats["repo_count"]:
+                # repos with no commit count are treated as having zero commits
+                max_commit_count = stats["max_commit_count"] or 0
 
                 # handles repos with the same commit count
-                top_repos_by_commit_count = [
-                    item["repo"] for item in top_repos_by_commit_count
-                ]
+                top_repos_by_commit_count = list(
+                    queryset.filter(
+                        main_branch_commit_count=max_commit_count
+                    ).values_list("repo", flat=True)
+                )
 
-                avg_stars_count = queryset.values("stars").aggregate(
-                    avg_stars_count=Avg("stars")
-                )["avg_stars_count"]
                 return Response(
                     {
                         "top_repos_by_commit_count": top_repos_by_commit_count,
                         "commit_count": max_commit_count,
-                        "avg_stars_count": avg_stars_count,
+                        "avg_stars_count": stats["avg_stars_count"],
                     }
                 )
             return Response(
@@ -195,7 +290,13 @@ class Stats(generics.ListAPIView):
         )
 
 
+def invalidate_cache() -> None:
+    """Drop cached responses that depend on stored repo data."""
+    cache.delete_many([ACCOUNTS_CACHE_KEY, STATS_CACHE_KEY])
+
+
 def clean_url(url: str) -> str:
     """Transform urls to a standard form."""
-    url = url.replace("http:", "https:")
-    return url[:-1] if url[-1] == "/" else url
+    if not (match := GITHUB_ACCOUNT_URL_RE.match(url)):
+        raise ValueError(f"Not a valid GitHub account URL: {url!r}.")
+    return f"https://github.com/{match.group(1)}"
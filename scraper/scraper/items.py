@@ -1,10 +1,10 @@
 """This modules define the models for scraped items."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Callable
 
-import scrapy
-from itemloaders.processors import Identity, Join, TakeFirst
-from scrapy import Field
+from itemloaders.processors import Compose, Identity, Join, TakeFirst
 
 
 def parse_utc_string(datestr: str) -> datetime:
@@ -14,57 +14,81 @@ def parse_utc_string(datestr: str) -> datetime:
 
 def strip_whitespace(text: str) -> str:
     """Strip both leading and trailing whitespace."""
-    return text.rstrip().lstrip()
+    return text.strip()
 
 
-def remove_thousand_separator(int_as_str: str) -> str:
-    """Removes thousand separator from a number stored as string."""
-    return int_as_str.replace(",", "")
+THOUSAND_SEPARATOR_TABLE = str.maketrans("", "", ",")
 
 
-class RepoInfoItem(scrapy.Item):
+def parse_int(int_as_str: str) -> int:
+    """Parse a number stored as string that may contain thousand separators."""
+    return int(int_as_str.translate(THOUSAND_SEPARATOR_TABLE))
+
+
+def loader_field(input_processor: Callable, output_processor: Callable):
+    """Declare an optional item field with processors used by item loaders."""
+    return field(
+        default=None,
+        metadata={
+            "input_processor": input_processor,
+            "output_processor": output_processor,
+        },
+    )
+
+
+@dataclass(slots=True)
+class RepoInfoItem:
     """Item encapsulating repository data."""
 
-    account = Field(input_processor=Identity(), output_processor=TakeFirst())
-    repo = Field(
+    account: str | None = loader_field(
+        input_processor=Identity(), output_processor=TakeFirst()
+    )
+    repo: str | None = loader_field(
         input_processor=lambda x: x[0].split("/")[-1], output_processor=TakeFirst()
     )
-    about = Field(
-        input_processor=Identity(), output_processor=lambda x: strip_whitespace(x[0])
+    about: str | None = loader_field(
+        input_processor=Identity(),
+        output_processor=Compose(TakeFirst(), strip_whitespace),
     )
-    website_link = Field(input_processor=Identity(), output_processor=TakeFirst())
-    stars = Field(
-        input_processor=lambda x: int(remove_thousand_separator(x[0])),
+    website_link: str | None = loader_field(
+        input_processor=Identity(), output_processor=TakeFirst()
+    )
+    stars: int | None = loader_field(
+        input_processor=lambda x: parse_int(x[0]),
         output_processor=TakeFirst(),
     )
-    forks = Field(
-        input_processor=lambda x: int(remove_thousand_separator(x[0])),
+    forks: int | None = loader_field(
+        input_processor=lambda x: parse_int(x[0]),
         output_processor=TakeFirst(),
     )
-    watching = Field(input_processor=Identity(), output_processor=TakeFirst())
-    release_count = Field(
+    watching: str | None = loader_field(
+        input_processor=Identity(), output_processor=TakeFirst()
+    )
+    release_count: int | None = loader_field(
         # return empty list to skip returning empty field
-        input_processor=lambda x: int(remove_thousand_separator(x[0])) if x else [],
+        input_processor=lambda x: parse_int(x[0]) if x else [],
         output_processor=TakeFirst(),
     )
 
-    main_branch_commit_count = Field(
-        input_processor=lambda x: int(remove_thousand_separator(x[0])),
+    main_branch_commit_count: int | None = loader_field(
+        input_processor=lambda x: parse_int(x[0]),
         output_processor=TakeFirst(),
     )
-    main_branch_latest_commit_author = Field(
+    main_branch_latest_commit_author: str | None = loader_field(
         input_processor=Identity(), output_processor=TakeFirst()
     )
-    main_branch_latest_commit_datetime = Field(
+    main_branch_latest_commit_datetime: str | None = loader_field(
         input_processor=Identity(), output_processor=TakeFirst()
     )
-    main_branch_latest_commit_message = Field(
-        input_processor=Join(), output_processor=lambda x: strip_whitespace(x[0])
+    main_branch_latest_commit_message: str | None = loader_field(
+        input_processor=Join(), output_processor=Compose(TakeFirst(), strip_whitespace)
+    )
+    latest_release_tag: str | None = loader_field(
+        input_processor=Identity(), output_processor=TakeFirst()
     )
-    latest_release_tag = Field(input_processor=Identity(), output_processor=TakeFirst())
-    latest_release_datetime = Field(
+    latest_release_datetime: str | None = loader_field(
         input_processor=Identity(), output_processor=TakeFirst()
     )
-    latest_release_changelog = Field(
-        input_processor=Join(), output_processor=lambda x: strip_whitespace(x[0])
+    latest_release_changelog: str | None = loader_field(
+        input_processor=Join(), output_processor=Compose(TakeFirst(), strip_whitespace)
     )
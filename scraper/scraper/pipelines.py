@@ -13,6 +13,13 @@ from .items import RepoInfoItem
 settings = get_project_settings()
 
 
+def item_to_dict(item) -> dict:
+    """Convert an item to a dict, skipping fields that have not been parsed."""
+    return {
+        name: value for name, value in ItemAdapter(item).items() if value is not None
+    }
+
+
 class MongoDBPipeline:
     """Pipeline that save scraped repo data to a MongoDB database."""
 
@@ -40,14 +47,14 @@ class MongoDBPipeline:
         if isinstance(item, RepoInfoItem):
             stored_repo = collection.find_one(
                 {
-                    "account": (account := item.get("account")),
-                    "repo": (repo := item.get("repo")),
+                    "account": (account := item.account),
+                    "repo": (repo := item.repo),
                 }
             )
             if stored_repo:  # rewrite data
                 collection.delete_one({"_id": stored_repo["_id"]})
                 logging.info(f"Rewriting existing repo data for '{account}/{repo}'.")
-            collection.insert_one(dict(item))
+            collection.insert_one(item_to_dict(item))
             logging.info(f"Info on '{account}/{repo}' added to MongoDB.")
             return item
 
@@ -55,11 +62,46 @@ class MongoDBPipeline:
 class APIPipeline:
     """Pipeline that calls api service to save items to postgres database."""
 
+    def __init__(self):
+        """Initialize the pipeline."""
+        self.api_service_uri = settings.get("API_SERVICE_URI")
+        self.batch_size = settings.getint("API_BATCH_SIZE")
+        self.buffer: list[dict] = []
+
+    def close_spider(self, _):
+        """Save the remaining items when closing the spider."""
+        self.flush()
+
     def process_item(self, item, _):
-        """Process each item and save it to the database."""
-        requests.post(
-            settings.get("API_SERVICE_URI") + "/add/",
-            data=json.dumps(ItemAdapter(item).asdict()),
-            headers={"Content-type": "application/json", "Accept": "application/json"},
-        )
+        """Buffer each item and save the batch once it is full."""
+        self.buffer.append(item_to_dict(item))
+        if len(self.buffer) >= self.batch_size:
+            self.flush()
         return item
+
+    def flush(self):
+        """Save buffered items to the database with a single request."""
+        if not self.buffer:
+            return
+        items, self.buffer = self.buffer, []
+        try:
+            response = requests.post(
+                self.api_service_uri + "/add_bulk/",
+                data=json.dumps({"items": items}),
+                headers={
+                    "Content-type": "application/json",
+                    "Accept": "application/json",
+                },
+            )
+        except requests.RequestException as error:
+            logging.error(f"Failed to save {len(items)} items: {error}.")
+            return
+        if response.status_code != 201:
+            logging.error(f"Failed to save {len(items)} items: {response.status_code}.")
+            return
+        for rejected in response.json()["rejected"]:
+            item = items[rejected["index"]]
+            logging.error(
+                f"Info on '{item.get('account')}/{item.get('repo')}' was rejected: "
+                f"{rejected['errors']}."
+            )
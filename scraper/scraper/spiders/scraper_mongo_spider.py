@@ -8,6 +8,12 @@ from scrapy.loader import ItemLoader
 
 from scraper.items import RepoInfoItem
 
+GITHUB_ACCOUNT_RE = re.compile(
+    r"^https?://github\.com/[a-z0-9](?:[a-z\d]|-(?=[a-z\d])){0,38}/?$"
+)
+REPOSITORIES_URL_RE = re.compile(r".*repositories.*")
+RELEASE_TAG_URL_RE = re.compile(r".*releases/tag.*")
+
 
 class ScraperMongoSpider(scrapy.Spider):
     """Spider to crawl github accounts and collect data on repos."""
@@ -22,9 +28,7 @@ class ScraperMongoSpider(scrapy.Spider):
         start_urls = []
         for url in self.start_urls.split(","):
             # ignore any domain other than github.com
-            if re.search(
-                r"^https?://github.com/[a-z0-9](?:[a-z\d]|-(?=[a-z\d])){0,38}/?$", url
-            ):
+            if GITHUB_ACCOUNT_RE.search(url):
                 url = url.replace("http:", "https:")
                 if url[-1] == "/":
                     url = url[:-1]
@@ -45,7 +49,7 @@ class ScraperMongoSpider(scrapy.Spider):
     def parse_account_page(self, response) -> None:
         """Parse a GitHUb account page to extract a link to account's repos."""
         loader = response.meta["loader"]
-        repos_url = response.css("[href]::attr(href)").re(".*repositories.*")[0]
+        repos_url = response.css("[href]::attr(href)").re(REPOSITORIES_URL_RE)[0]
         yield response.follow(
             repos_url, callback=self.parse_repos_page, meta={"loader": loader}
         )
@@ -60,10 +64,9 @@ class ScraperMongoSpider(scrapy.Spider):
         if not repo_urls:  # handle empty accounts
             yield loader.load_item()
 
-        for url in repo_urls:
-            yield response.follow(
-                url, callback=self.parse_repo_info, meta={"loader": loader}
-            )
+        yield from response.follow_all(
+            repo_urls, callback=self.parse_repo_info, meta={"loader": loader}
+        )
 
         next_page_url = response.css("a.next_page::attr(href)").get()
         # set DOWNLOAD_DELAY = 0.5 in settings.py
@@ -158,7 +161,7 @@ class ScraperMongoSpider(scrapy.Spider):
     def parse_releases_page(self, response):
         """Parse releases page to extract data about the latest release."""
         loader = response.meta["loader"]
-        releases = response.css("a::attr(href)").re(".*releases/tag.*")
+        releases = response.css("a::attr(href)").re(RELEASE_TAG_URL_RE)
         if releases:
             yield response.follow(
                 releases[0],